@@ -1,7 +1,7 @@
 """Helper components for data transformation such as embeddings and document splitting."""
 
 from copy import deepcopy
-from typing import List, TypeVar, Sequence, Union, Dict, Any
+from typing import List, TypeVar, Sequence, Union, Set, Any
 from tqdm import tqdm
 
 
@@ -41,7 +41,6 @@ def retriever_output_to_context_str(
     If you used query expansion, you might want to deduplicate the chunks.
     """
     chunks_to_use: List[Document] = []
-    context_str = ""
     sep = " "
     if isinstance(retriever_output, RetrieverOutput):
         chunks_to_use = retriever_output.documents
@@ -49,17 +48,15 @@ def retriever_output_to_context_str(
         for output in retriever_output:
             chunks_to_use.extend(output.documents)
     if deduplicate:
-        unique_chunks_ids = set([chunk.id for chunk in chunks_to_use])
-        # id and if it is used, it will be True
-        used_chunk_in_context_str: Dict[Any, bool] = {
-            id: False for id in unique_chunks_ids
-        }
+        # keep the first occurrence of each chunk id, in order
+        used_chunk_ids: Set[Any] = set()
+        unique_chunks: List[Document] = []
         for chunk in chunks_to_use:
-            if not used_chunk_in_context_str[chunk.id]:
-                context_str += sep + chunk.text
-                used_chunk_in_context_str[chunk.id] = True
-    else:
-        context_str = sep.join([chunk.text for chunk in chunks_to_use])
+            if chunk.id not in used_chunk_ids:
+                used_chunk_ids.add(chunk.id)
+                unique_chunks.append(chunk)
+        chunks_to_use = unique_chunks
+    context_str = sep.join([chunk.text for chunk in chunks_to_use])
     return context_str
 
 
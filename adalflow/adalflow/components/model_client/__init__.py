@@ -48,6 +48,10 @@ OllamaClient = LazyImport(
     "adalflow.components.model_client.ollama_client.OllamaClient",
     OptionalPackages.OLLAMA,
 )
+get_openai_client = LazyImport(
+    "adalflow.components.model_client.openai_client.get_openai_client",
+    OptionalPackages.OPENAI,
+)
 get_first_message_content = LazyImport(
     "adalflow.components.model_client.openai_client.get_first_message_content",
     OptionalPackages.OPENAI,
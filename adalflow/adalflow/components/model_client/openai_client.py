@@ -1,6 +1,7 @@
 """OpenAI ModelClient integration."""
 
 import os
+from functools import lru_cache
 from typing import (
     Dict,
     Sequence,
@@ -16,7 +17,6 @@ from typing import (
 import re
 
 import logging
-import backoff
 
 # optional import
 from adalflow.utils.lazy_import import safe_import, OptionalPackages
@@ -24,14 +24,8 @@ from adalflow.utils.lazy_import import safe_import, OptionalPackages
 
 openai = safe_import(OptionalPackages.OPENAI.value[0], OptionalPackages.OPENAI.value[1])
 
-from openai import OpenAI, AsyncOpenAI, Stream
-from openai import (
-    APITimeoutError,
-    InternalServerError,
-    RateLimitError,
-    UnprocessableEntityError,
-    BadRequestError,
-)
+import httpx  # installed with openai
+from openai import OpenAI, AsyncOpenAI, Stream, AsyncStream
 from openai.types import (
     Completion,
     CreateEmbeddingResponse,
@@ -76,6 +70,14 @@ def handle_streaming_response(generator: Stream[ChatCompletionChunk]):
         yield parsed_content
 
 
+async def handle_async_streaming_response(generator: AsyncStream[ChatCompletionChunk]):
+    r"""Handle the async streaming response."""
+    async for completion in generator:
+        log.debug(f"Raw chunk completion: {completion}")
+        parsed_content = parse_stream_response(completion)
+        yield parsed_content
+
+
 def get_all_messages_content(completion: ChatCompletion) -> List[str]:
     r"""When the n > 1, get all the messages content."""
     return [c.message.content for c in completion.choices]
@@ -114,6 +116,18 @@ class OpenAIClient(ModelClient):
         api_key (Optional[str], optional): OpenAI API key. Defaults to None.
         chat_completion_parser (Callable[[Completion], Any], optional): A function to parse the chat completion to a str. Defaults to None.
             Default is `get_first_message_content`.
+        pool_size (int, optional): The maximum number of HTTP connections kept by each of the sync and async clients.
+            Half of them are kept alive for reuse. Raise it when you run many concurrent calls, e.g. with ``Generator.abatch``. Defaults to 100.
+        timeout (Optional[float], optional): The request timeout in seconds, with a 5 seconds connect timeout. Defaults to 30.0.
+        max_retries (int, optional): The maximum number of retries by the OpenAI SDK. Defaults to 3.
+            Only the transient errors are retried (connection errors, timeouts, 408, 409, 429 and 5xx), with a jittered exponential backoff that respects the ``Retry-After`` header.
+            A bad request is not retried, it would fail the same way again.
+        max_tokens (Optional[int], optional): The default ``max_tokens`` of the chat completions to bound the latency and size of the response.
+            It only applies when neither ``max_tokens`` nor ``max_completion_tokens`` is in the model_kwargs. Defaults to 512.
+
+    Note:
+        The HTTP connection pool is created once per client and reused across the calls.
+        Call ``close()`` or ``await aclose()`` to release the connections when you are done.
 
     References:
         - Embeddings models: https://platform.openai.com/docs/guides/embeddings
@@ -126,6 +140,10 @@ class OpenAIClient(ModelClient):
         api_key: Optional[str] = None,
         chat_completion_parser: Callable[[Completion], Any] = None,
         input_type: Literal["text", "messages"] = "text",
+        pool_size: int = 100,
+        timeout: Optional[float] = 30.0,
+        max_retries: int = 3,
+        max_tokens: Optional[int] = 512,
     ):
         r"""It is recommended to set the OPENAI_API_KEY environment variable instead of passing it as an argument.
 
@@ -134,6 +152,19 @@ class OpenAIClient(ModelClient):
         """
         super().__init__()
         self._api_key = api_key
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._max_tokens = max_tokens
+        unbounded = [
+            name
+            for name, value in [("timeout", timeout), ("max_tokens", max_tokens)]
+            if value is None
+        ]
+        if unbounded:
+            log.warning(
+                f"{type(self).__name__} is created with unbounded {unbounded}, a runaway call can take very long and return a huge response."
+            )
         self.sync_client = self.init_sync_client()
         self.async_client = None  # only initialize if the async call is called
         self.chat_completion_parser = (
@@ -141,17 +172,49 @@ class OpenAIClient(ModelClient):
         )
         self._input_type = input_type
 
+    def _get_client_kwargs(self) -> Dict[str, Any]:
+        r"""The shared timeout, retry and connection pool settings for both sync and async clients."""
+        return {
+            "timeout": httpx.Timeout(self._timeout, connect=5.0),
+            "max_retries": self._max_retries,
+        }
+
+    def _get_connection_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self._pool_size,
+            max_keepalive_connections=max(1, self._pool_size // 2),
+        )
+
     def init_sync_client(self):
         api_key = self._api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("Environment variable OPENAI_API_KEY must be set")
-        return OpenAI(api_key=api_key)
+        return OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(limits=self._get_connection_limits()),
+            **self._get_client_kwargs(),
+        )
 
     def init_async_client(self):
         api_key = self._api_key or os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("Environment variable OPENAI_API_KEY must be set")
-        return AsyncOpenAI(api_key=api_key)
+        return AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=self._get_connection_limits()),
+            **self._get_client_kwargs(),
+        )
+
+    def close(self):
+        r"""Close the sync client and release its HTTP connections."""
+        if self.sync_client is not None:
+            self.sync_client.close()
+
+    async def aclose(self):
+        r"""Close both clients and release their HTTP connections."""
+        self.close()
+        if self.async_client is not None:
+            await self.async_client.close()
 
     # def _parse_chat_completion(self, completion: ChatCompletion) -> "GeneratorOutput":
     #     # TODO: raw output it is better to save the whole completion as a source of truth instead of just the message
@@ -169,8 +232,17 @@ class OpenAIClient(ModelClient):
         self,
         completion: Union[ChatCompletion, Generator[ChatCompletionChunk, None, None]],
     ) -> "GeneratorOutput":
-        """Parse the completion, and put it into the raw_response."""
+        """Parse the completion, and put it into the raw_response.
+
+        For a streaming completion, the raw_response is a (async) generator of the content deltas.
+        """
         log.debug(f"completion: {completion}, parser: {self.chat_completion_parser}")
+        if isinstance(completion, Stream):
+            return GeneratorOutput(raw_response=handle_streaming_response(completion))
+        if isinstance(completion, AsyncStream):
+            return GeneratorOutput(
+                raw_response=handle_async_streaming_response(completion)
+            )
         try:
             data = self.chat_completion_parser(completion)
             usage = self.track_completion_usage(completion)
@@ -257,21 +329,16 @@ class OpenAIClient(ModelClient):
             if len(messages) == 0:
                 messages.append({"role": "system", "content": input})
             final_model_kwargs["messages"] = messages
+            if self._max_tokens and not (
+                "max_tokens" in final_model_kwargs
+                or "max_completion_tokens" in final_model_kwargs
+            ):
+                final_model_kwargs["max_tokens"] = self._max_tokens
         else:
             raise ValueError(f"model_type {model_type} is not supported")
         return final_model_kwargs
 
-    @backoff.on_exception(
-        backoff.expo,
-        (
-            APITimeoutError,
-            InternalServerError,
-            RateLimitError,
-            UnprocessableEntityError,
-            BadRequestError,
-        ),
-        max_time=5,
-    )
+    # retries are done by the OpenAI SDK client, see max_retries
     def call(self, api_kwargs: Dict = {}, model_type: ModelType = ModelType.UNDEFINED):
         """
         kwargs is the combined input and model_kwargs.  Support streaming call.
@@ -282,23 +349,11 @@ class OpenAIClient(ModelClient):
         elif model_type == ModelType.LLM:
             if "stream" in api_kwargs and api_kwargs.get("stream", False):
                 log.debug("streaming call")
-                self.chat_completion_parser = handle_streaming_response
-                return self.sync_client.chat.completions.create(**api_kwargs)
             return self.sync_client.chat.completions.create(**api_kwargs)
         else:
             raise ValueError(f"model_type {model_type} is not supported")
 
-    @backoff.on_exception(
-        backoff.expo,
-        (
-            APITimeoutError,
-            InternalServerError,
-            RateLimitError,
-            UnprocessableEntityError,
-            BadRequestError,
-        ),
-        max_time=5,
-    )
+    # retries are done by the OpenAI SDK client, see max_retries
     async def acall(
         self, api_kwargs: Dict = {}, model_type: ModelType = ModelType.UNDEFINED
     ):
@@ -333,6 +388,28 @@ class OpenAIClient(ModelClient):
         return output
 
 
+@lru_cache(maxsize=8)
+def get_openai_client(**config) -> OpenAIClient:
+    r"""Get a shared :class:`OpenAIClient` for the given config, creating it on the first call.
+
+    Reusing the client keeps its connection pool warm across components and use cases,
+    instead of paying the connection setup for every new ``OpenAIClient()``.
+    The config is passed to :class:`OpenAIClient` and should be hashable, e.g. ``api_key``, ``timeout``, ``max_retries``.
+
+    Example:
+
+    .. code-block:: python
+
+        from adalflow.components.model_client.openai_client import get_openai_client
+
+        generator = Generator(
+            model_client=get_openai_client(),
+            model_kwargs={"model": "gpt-3.5-turbo"},
+        )
+    """
+    return OpenAIClient(**config)
+
+
 # if __name__ == "__main__":
 #     from adalflow.core import Generator
 #     from adalflow.utils import setup_env, get_logger
@@ -1,8 +1,8 @@
 """BM25 retriever implementation. """
 
 from typing import List, Dict, Optional, Callable, Any, Sequence
+from collections import Counter
 import numpy as np
-import heapq
 import math
 import logging
 
@@ -152,6 +152,9 @@ class BM25Retriever(Retriever[str, RetrieverStrQueryType]):
         - doc_len: list of document lengths (|d| in the formula)
         - avgdl: average document length in the corpus (avgdl in the formula)
         - total_documents: total number of documents in the corpus (N in the formula)
+
+        The dicts above are the saved index. For scoring, they are also packed into flat numpy arrays
+        (see :meth:`_build_postings`), where the postings of each term are contiguous.
         """
         super().__init__()
         self.k1 = k1
@@ -177,7 +180,7 @@ class BM25Retriever(Retriever[str, RetrieverStrQueryType]):
             "b",
             "epsilon",
             "indexed",
-            "use_tokenizer",
+            "_use_tokenizer",
         ]
         # initialize the index
         self.reset_index()
@@ -196,6 +199,43 @@ class BM25Retriever(Retriever[str, RetrieverStrQueryType]):
             False  # this is important to check if the retrieve is possible
         )
         self.total_documents: int = 0
+        self._reset_postings()
+
+    def _reset_postings(self):
+        self._vocab: Dict[str, int] = {}  # term to term id
+        self._idf_array = np.zeros(0, dtype=np.float64)  # idf of each term id
+        # postings of term id t are [_term_ptr[t], _term_ptr[t + 1]) in _posting_docs/_posting_freqs
+        self._term_ptr = np.zeros(1, dtype=np.int64)
+        self._posting_docs = np.zeros(0, dtype=np.int32)  # document index
+        self._posting_freqs = np.zeros(0, dtype=np.int32)  # f(q_i, d)
+        self._doc_len_array = np.zeros(0, dtype=np.int32)  # |d|
+
+    def _build_postings(self):
+        r"""Pack ``t2d``, ``idf`` and ``doc_len`` into the flat arrays used for scoring.
+
+        It is the CSC layout of the sparse document-term frequency matrix: the documents and frequencies
+        of each term are stored contiguously and sorted by the document index.
+        """
+        self._vocab = {token: i for i, token in enumerate(self.nd)}
+        term_ids, doc_ids, freqs = [], [], []
+        for doc_idx, term_freq in enumerate(self.t2d):
+            for token, freq in term_freq.items():
+                term_ids.append(self._vocab[token])
+                doc_ids.append(doc_idx)
+                freqs.append(freq)
+        term_ids = np.array(term_ids, dtype=np.int32)
+        # stable to keep the documents of each term in order
+        order = np.argsort(term_ids, kind="stable")
+        self._posting_docs = np.array(doc_ids, dtype=np.int32)[order]
+        self._posting_freqs = np.array(freqs, dtype=np.int32)[order]
+        self._term_ptr = np.zeros(len(self._vocab) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(term_ids, minlength=len(self._vocab)), out=self._term_ptr[1:]
+        )
+        self._idf_array = np.array(
+            [self.idf.get(token, 0.0) for token in self._vocab], dtype=np.float64
+        )
+        self._doc_len_array = np.array(self.doc_len, dtype=np.int32)
 
     def _apply_split_function(self, documents: List[str]):
         if self._split_function is None:
@@ -250,22 +290,55 @@ class BM25Retriever(Retriever[str, RetrieverStrQueryType]):
         for token in negative_idf:
             self.idf[token] = eps
 
-    def _get_scores(self, query: List[str]) -> List[float]:
-        r"""Calculate the BM25 score for the query and the documents in the corpus
+    def _get_score_array(self, query: List[str]) -> np.ndarray:
+        r"""Calculate the BM25 score for the query and the documents in the corpus as a numpy array.
+
+        The document length normalization is computed once per query, repeated query terms are scored once
+        and weighted by their count, and terms without idf (not in the corpus) are skipped.
+        Only the documents in the postings of each term are updated, the others have f(q_i, d) = 0 and score 0.
 
         Args:
             query: List[str]: The tokenized query
         """
         score = np.zeros(self.total_documents)
-        doc_len = np.array(self.doc_len)
-        for q in query:
-            q_freq = np.array([(doc.get(q) or 0) for doc in self.t2d])
-            score += (self.idf.get(q) or 0) * (
-                q_freq
-                * (self.k1 + 1)
-                / (q_freq + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl))
+        doc_len_norm = self.k1 * (
+            1 - self.b + self.b * self._doc_len_array / self.avgdl
+        )
+        for q, q_count in Counter(query).items():
+            term_id = self._vocab.get(q)
+            if term_id is None:
+                continue
+            idf = self._idf_array[term_id]
+            if not idf:
+                continue
+            start, end = self._term_ptr[term_id], self._term_ptr[term_id + 1]
+            docs = self._posting_docs[start:end]
+            q_freq = self._posting_freqs[start:end].astype(np.float64)
+            score[docs] += (
+                q_count * idf * (q_freq * (self.k1 + 1) / (q_freq + doc_len_norm[docs]))
             )
-        return score.tolist()
+        return score
+
+    def _get_scores(self, query: List[str]) -> List[float]:
+        r"""Calculate the BM25 score for the query and the documents in the corpus
+
+        Args:
+            query: List[str]: The tokenized query
+        """
+        return self._get_score_array(query).tolist()
+
+    @staticmethod
+    def _get_top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+        r"""Get the indices of the top_k scores in descending order in O(N), ties are broken by the lower index."""
+        num_scores = len(scores)
+        top_k = min(top_k, num_scores)
+        if top_k <= 0:
+            return np.array([], dtype=np.int64)
+        # all candidates that are at least the k-th largest score, including the ties
+        kth_score = np.partition(scores, num_scores - top_k)[num_scores - top_k]
+        candidates = np.flatnonzero(scores >= kth_score)
+        order = np.argsort(-scores[candidates], kind="stable")
+        return candidates[order][:top_k]
 
     def _get_batch_scores(self, query: List[str], doc_ids: List[int]) -> List[float]:
         r"""Calculate the BM25 score for the query and the documents in the corpus
@@ -309,6 +382,7 @@ class BM25Retriever(Retriever[str, RetrieverStrQueryType]):
         self.tokenized_documents = self._apply_split_function(list_of_documents_str)
         self._initialize(self.tokenized_documents)
         self._calc_idf()
+        self._build_postings()
         self.indexed = True
 
     def call(
@@ -335,9 +409,9 @@ class BM25Retriever(Retriever[str, RetrieverStrQueryType]):
         # process each query
         for query in input:
             tokens = self._split_function(query)
-            scores = self._get_scores(tokens)
-            top_k_idx = heapq.nlargest(top_k, range(len(scores)), scores.__getitem__)
-            top_k_scores = [scores[i] for i in top_k_idx]
+            scores = self._get_score_array(tokens)
+            top_k_idx = self._get_top_k(scores, top_k).tolist()
+            top_k_scores = scores[top_k_idx].tolist()
             output.append(
                 RetrieverOutput(
                     doc_indices=top_k_idx, doc_scores=top_k_scores, query=query
@@ -362,13 +436,20 @@ class BM25Retriever(Retriever[str, RetrieverStrQueryType]):
         # create an instance of the class
         try:
             index_dict = load_json(path)
-            instance = cls.from_dict(index_dict)
+            # init the component states first, the file only has the index_keys
+            instance = cls()
+            for key, value in index_dict["data"].items():
+                setattr(instance, key, value)
             # add the split function
             instance._split_function = (
                 split_text_by_word_fn_then_lower_tokenized
                 if instance._use_tokenizer
                 else split_text_by_word_fn
             )
+            # the arrays are not saved, rebuild them from the loaded index
+            instance._reset_postings()
+            if instance.indexed:
+                instance._build_postings()
             return instance
         except Exception as e:
             log.error(f"Error loading the index from file: {e}")
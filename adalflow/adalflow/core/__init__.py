@@ -10,6 +10,7 @@ from .model_client import ModelClient
 
 # from .parameter import Parameter
 from .prompt_builder import Prompt
+from .rate_limiter import RateLimiter
 
 from .retriever import Retriever
 from .tokenizer import Tokenizer
@@ -58,6 +59,7 @@ __all__ = [
     "Generator",
     "BackwardEngine",
     "Prompt",
+    "RateLimiter",
     "DEFAULT_LIGHTRAG_SYSTEM_PROMPT",
     # "Parameter",
     "required_field",
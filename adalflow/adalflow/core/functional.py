@@ -30,6 +30,11 @@ import threading
 from inspect import signature, Parameter
 from dataclasses import fields, is_dataclass, MISSING, Field
 
+try:
+    import orjson  # optional, a faster drop-in for json.loads and json.dumps
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 ExcludeType = Optional[Dict[str, List[str]]]
@@ -1210,15 +1215,50 @@ def parse_yaml_str_to_obj(yaml_str: str) -> Dict[str, Any]:
         raise ImportError("Please pip install PyYAML.") from exc
 
 
+def _json_dumps(obj: Any) -> str:
+    r"""Dump an object to a JSON string for logging, with orjson if it is installed.
+
+    Values that are not JSON serializable, such as Parameter, are converted with ``str``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass
+    try:
+        return json.dumps(obj, default=str)
+    except (TypeError, ValueError):
+        return repr(obj)
+
+
+def _json_loads(json_str: str) -> Any:
+    r"""Load a JSON string with orjson if it is installed, and fall back to the non-strict json.loads.
+
+    Most LLM outputs are valid JSON and take the fast path. ``strict=False`` allows control characters,
+    such as raw newlines, inside the strings which LLMs often produce.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str, strict=False)
+
+
 def parse_json_str_to_obj(json_str: str) -> Union[Dict[str, Any], List[Any]]:
     r"""Parse a varietry of json format string to Python object.
 
     json_str: has to be a valid JSON string. Either {} or [].
+
+    The lenient parsers are only tried in order when the previous one fails:
+    orjson (if installed) and json.loads, json.loads after fixing common errors, and yaml.safe_load.
     """
     json_str = json_str.strip()
-    # 1st attemp with json.loads
+    # 1st attemp with orjson/json.loads
     try:
-        json_obj = json.loads(json_str)
+        json_obj = _json_loads(json_str)
         return json_obj
     except json.JSONDecodeError as e:
         log.info(
@@ -1231,7 +1271,7 @@ def parse_json_str_to_obj(json_str: str) -> Union[Dict[str, Any], List[Any]]:
             log.info("Trying to fix scaped single quotes...")
             json_str = fix_json_escaped_single_quotes(json_str)
             log.info(f"Fixed JSON string: {json_str}")
-            json_obj = json.loads(json_str)
+            json_obj = _json_loads(json_str)
             return json_obj
         except json.JSONDecodeError:
             # 3rd attemp using yaml
@@ -4,10 +4,23 @@ It is a pipeline that consists of three subcomponents."""
 
 import os
 import json
-
-from typing import Any, Dict, Optional, Union, Callable, Tuple, List
+import asyncio
+
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union,
+    Callable,
+    Tuple,
+    List,
+    Iterator,
+    AsyncIterator,
+)
 from copy import deepcopy
+from functools import lru_cache
 import logging
+from jinja2 import Template
 
 
 from adalflow.core.types import (
@@ -23,9 +36,18 @@ from adalflow.core.base_data_class import DataClass
 from adalflow.optim.parameter import Parameter, GradientContext
 from adalflow.optim.types import ParameterType
 
-from adalflow.core.prompt_builder import Prompt
-from adalflow.core.functional import compose_model_kwargs
+from adalflow.core.prompt_builder import (
+    Prompt,
+    _convert_prompt_kwargs_to_str,
+)
+from adalflow.core.functional import (
+    _json_dumps,
+    compose_model_kwargs,
+    extract_json_str,
+    parse_json_str_to_obj,
+)
 from adalflow.core.model_client import ModelClient
+from adalflow.core.rate_limiter import RateLimiter
 from adalflow.core.default_prompt_template import DEFAULT_LIGHTRAG_SYSTEM_PROMPT
 from adalflow.optim.function import BackwardContext
 from adalflow.utils.cache import CachedEngine
@@ -46,6 +68,34 @@ log = logging.getLogger(__name__)
 
 PromptArgType = Dict[str, Union[str, Parameter]]
 
+# more prompts per request save requests per minute, but the latency and the error rate grow
+MAX_MARSHAL_SIZE = 8
+
+MARSHALED_PROMPTS_TEMPLATE = r"""You are given {{prompts|length}} independent prompts, each starts with "### Prompt <number>".
+Answer each prompt on its own and follow its instructions.
+Respond only with a JSON list of {{prompts|length}} strings, where the i-th string is the complete answer to Prompt i.
+{% for prompt in prompts %}
+
+### Prompt {{loop.index}}
+{{prompt}}
+{% endfor %}
+"""
+
+
+# only these values are cached, other objects can change after they are hashed
+_CACHEABLE_PROMPT_VALUE_TYPES = (str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=256)
+def _render_prompt_cached(jinja2_template: Template, prompt_kwargs_items: Tuple) -> str:
+    r"""Render the template with the sorted (key, type, float repr, value) items and strip it. Repeated prompts skip both the Jinja2 rendering and the strip.
+
+    The type is part of the key because ``1 == 1.0 == True`` hash the same but render differently.
+    """
+    return jinja2_template.render(
+        **{key: value for key, *_, value in prompt_kwargs_items}
+    ).strip()
+
 
 class Generator(GradComponent, CachedEngine, CallbackManager):
     __doc__ = """An user-facing orchestration component for LLM prediction.
@@ -65,6 +115,7 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         prompt_kwargs (Optional[Dict], optional): The preset prompt kwargs to fill in the variables in the prompt. Defaults to None.
         output_processors (Optional[Component], optional):  The output processors after model call. It can be a single component or a chained component via ``Sequential``. Defaults to None.
         trainable_params (Optional[List[str]], optional): The list of trainable parameters. Defaults to [].
+        rate_limiter (Optional[RateLimiter], optional): Throttle the model calls before they are sent to stay under the rpm/tpm limits of the provider. Defaults to None.
 
     Note:
         The output_processors will be applied to the string output of the model completion. And the result will be stored in the data field of the output. And we encourage you to only use it to parse the response to data format you will use later.
@@ -81,16 +132,18 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         *,
         # args for the model
         model_client: ModelClient,  # will be intialized in the main script
-        model_kwargs: PromptArgType = {},
+        model_kwargs: Optional[PromptArgType] = None,
         # args for the prompt
         template: Optional[str] = None,
-        prompt_kwargs: Optional[Dict] = {},
+        prompt_kwargs: Optional[Dict] = None,
         # args for the output processing
         output_processors: Optional[Component] = None,
         name: Optional[str] = None,
         # args for the cache
         cache_path: Optional[str] = None,
         use_cache: bool = False,
+        # args for the rate limiting
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         r"""The default prompt is set to the DEFAULT_LIGHTRAG_SYSTEM_PROMPT. It has the following variables:
         - task_desc_str
@@ -110,6 +163,8 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
             )
 
         template = template or DEFAULT_LIGHTRAG_SYSTEM_PROMPT
+        model_kwargs = model_kwargs or {}
+        prompt_kwargs = prompt_kwargs or {}
         try:
             prompt_kwargs = deepcopy(prompt_kwargs)
         except Exception as e:
@@ -154,6 +209,7 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         self.set_data_map_func()
         self.model_str = model_str
         self._use_cache = use_cache
+        self.rate_limiter = rate_limiter
 
         self._kwargs = {
             "model_client": model_client,
@@ -164,6 +220,7 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
             "name": name,
             "cache_path": cache_path,
             "use_cache": use_cache,
+            "rate_limiter": rate_limiter,
         }
         self._teacher: Optional["Generator"] = None
 
@@ -276,6 +333,35 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         # prompt_kwargs_str = _convert_prompt_kwargs_to_str(kwargs)
         return self.prompt.call(**kwargs)
 
+    def _render_prompt(self, prompt_kwargs: Dict) -> str:
+        r"""Render the stripped prompt, memoized on the prompt's Jinja2 template and the fully composed prompt kwargs.
+
+        Parameters are resolved to their current data in the cache key, so updates from the optimizer are always picked up.
+        Falls back to ``Prompt.call`` when any value is not a str, int, float, bool or None, e.g. a list or an object
+        that can change after it is hashed, or when the prompt overrides ``call``.
+        """
+        if type(self.prompt).call is not Prompt.call:
+            return self.prompt.call(**prompt_kwargs).strip()
+        pass_kwargs = _convert_prompt_kwargs_to_str(
+            self.prompt.compose_prompt_kwargs(**prompt_kwargs)
+        )
+        if not all(
+            type(value) in _CACHEABLE_PROMPT_VALUE_TYPES
+            for value in pass_kwargs.values()
+        ):
+            return self.prompt.call(**prompt_kwargs).strip()
+        # floats also key on their repr, 0.0 == -0.0 but they render differently
+        prompt_kwargs_items = tuple(
+            (key, type(value), repr(value) if type(value) is float else None, value)
+            for key, value in sorted(pass_kwargs.items())
+        )
+        try:
+            return _render_prompt_cached(
+                self.prompt.jinja2_template, prompt_kwargs_items
+            )
+        except Exception as e:
+            raise ValueError(f"Error rendering Jinja2 template: {e}")
+
     def _extra_repr(self) -> str:
         s = f"model_kwargs={self.model_kwargs}, model_type={self.model_type}"
         return s
@@ -284,6 +370,15 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         r"""Get string completion and process it with the output_processors."""
         # parse chat completion will only fill the raw_response
         output: GeneratorOutput = self.model_client.parse_chat_completion(completion)
+        return self._apply_output_processors(output)
+
+    def _post_call_streaming(self, parts: List[str]) -> GeneratorOutput:
+        r"""Join the streamed text deltas once and process it with the output_processors."""
+        output = GeneratorOutput(raw_response="".join(parts))
+        return self._apply_output_processors(output)
+
+    def _apply_output_processors(self, output: GeneratorOutput) -> GeneratorOutput:
+        r"""Fill the data field of the output by processing the raw_response with the output_processors."""
         # Now adding the data filed to the output
         data = output.raw_response
         if self.output_processors:
@@ -300,13 +395,37 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
 
         return output
 
+    def _parse_stream_deltas(self, completion: Any) -> Union[str, Any]:
+        r"""Get the iterable of the text deltas from a streaming completion.
+
+        Model clients either return a GeneratorOutput with the deltas in the raw_response, or yield a GeneratorOutput per chunk.
+        A str is returned as is when the model client does not stream.
+        """
+        parsed = self.model_client.parse_chat_completion(completion)
+        if isinstance(parsed, GeneratorOutput):
+            if parsed.error:
+                raise ValueError(parsed.error)
+            parsed = parsed.raw_response
+        return parsed
+
+    @staticmethod
+    def _get_delta_str(chunk: Any) -> Optional[str]:
+        if isinstance(chunk, GeneratorOutput):
+            chunk = chunk.raw_response
+        return chunk or None
+
     def _pre_call(self, prompt_kwargs: Dict, model_kwargs: Dict) -> Dict[str, Any]:
         r"""Prepare the input, prompt_kwargs, model_kwargs for the model call."""
         # 1. render the prompt from the template
-        prompt_str = self.prompt.call(**prompt_kwargs).strip()
+        prompt_str = self._render_prompt(prompt_kwargs)
 
         # 2. combine the model_kwargs with the default model_kwargs
-        composed_model_kwargs = self._compose_model_kwargs(**model_kwargs)
+        # skip the copy and merge when there is nothing to override, the model client copies it anyway
+        composed_model_kwargs = (
+            self._compose_model_kwargs(**model_kwargs)
+            if model_kwargs
+            else self.model_kwargs
+        )
 
         # 3. convert app's inputs to api inputs
         api_kwargs = self.model_client.convert_inputs_to_api_kwargs(
@@ -316,18 +435,43 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         )
         return api_kwargs
 
+    @staticmethod
+    def _estimate_num_tokens(api_kwargs: Dict) -> int:
+        r"""Roughly estimate the tokens of a request (~4 chars per token) plus its max completion tokens for rate limiting.
+
+        Only the prompt text is counted, from the ``input``, ``prompt`` or ``messages`` content of the api_kwargs.
+        """
+        texts = [api_kwargs.get(key) for key in ("input", "prompt", "system")]
+        for message in api_kwargs.get("messages") or []:
+            content = message.get("content") if isinstance(message, dict) else None
+            if isinstance(content, list):  # content parts, e.g. text and images
+                texts.extend(
+                    part.get("text") for part in content if isinstance(part, dict)
+                )
+            else:
+                texts.append(content)
+        prompt_len = sum(len(text) for text in texts if isinstance(text, str))
+        max_tokens = (
+            api_kwargs.get("max_tokens")
+            or api_kwargs.get("max_completion_tokens")
+            or 256
+        )
+        return prompt_len // 4 + max_tokens
+
     def _model_client_call(self, api_kwargs: Dict, use_cache: bool = False) -> Any:
         # call the model client
         try:
             # check the cache
-            index_content = json.dumps(api_kwargs)  # + f"training: {self.training}"
+            index_content = None
             if use_cache:
-                # print(f"check cache first: {no_cache}")
-
+                # only serialize the api_kwargs when the cache is used
+                index_content = json.dumps(api_kwargs)  # + f"training: {self.training}"
                 cached_completion = self._check_cache(index_content)
                 if cached_completion is not None:
                     return cached_completion
 
+            if self.rate_limiter:
+                self.rate_limiter.acquire(self._estimate_num_tokens(api_kwargs))
             completion = self.model_client.call(
                 api_kwargs=api_kwargs, model_type=self.model_type
             )
@@ -410,13 +554,18 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
     # NOTE: when training is true, forward will be called in __call__ instead of call
     def forward(
         self,
-        prompt_kwargs: Optional[Dict] = {},  # the input need to be passed to the prompt
-        model_kwargs: Optional[Dict] = {},
+        # the input need to be passed to the prompt
+        prompt_kwargs: Optional[Dict] = None,
+        model_kwargs: Optional[Dict] = None,
         id: Optional[str] = None,
     ) -> "Parameter":
+        prompt_kwargs = prompt_kwargs or {}
+        model_kwargs = model_kwargs or {}
         # 1. call the model
         output: GeneratorOutputType = None
         input_args = {}
+        # compose the prompt kwargs once, it is reused for tracing and the backward context
+        combined_prompt_kwargs = compose_model_kwargs(self.prompt_kwargs, prompt_kwargs)
         if self.mock_output:
             output = GeneratorOutput(data=self.mock_output_data)
         else:
@@ -435,16 +584,13 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
                 output = self._teacher.call(prompt_kwargs, model_kwargs)
             else:
                 input_args = {
-                    "prompt_kwargs": compose_model_kwargs(
-                        self.prompt_kwargs, prompt_kwargs
-                    ),
+                    "prompt_kwargs": combined_prompt_kwargs,
                     "model_kwargs": compose_model_kwargs(
                         self.model_kwargs, model_kwargs
                     ),
                 }
                 output = self.call(prompt_kwargs, model_kwargs)
         # 2. Generate a Parameter object from the output
-        combined_prompt_kwargs = compose_model_kwargs(self.prompt_kwargs, prompt_kwargs)
         if self.data_map_func is None:
             self.set_data_map_func()
 
@@ -725,8 +871,9 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
 
     def call(
         self,
-        prompt_kwargs: Optional[Dict] = {},  # the input need to be passed to the prompt
-        model_kwargs: Optional[Dict] = {},
+        # the input need to be passed to the prompt
+        prompt_kwargs: Optional[Dict] = None,
+        model_kwargs: Optional[Dict] = None,
         use_cache: Optional[bool] = None,
         id: Optional[str] = None,
     ) -> GeneratorOutputType:
@@ -737,11 +884,18 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         if self.mock_output:
             return GeneratorOutput(data=self.mock_output_data, id=id)
 
-        log.debug(f"prompt_kwargs: {prompt_kwargs}")
-        log.debug(f"model_kwargs: {model_kwargs}")
+        prompt_kwargs = prompt_kwargs or {}
+        model_kwargs = model_kwargs or {}
+
+        # only serialize the (possibly large) kwargs when they are actually logged
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            log.debug(f"prompt_kwargs: {_json_dumps(prompt_kwargs)}")
+            log.debug(f"model_kwargs: {_json_dumps(model_kwargs)}")
 
         api_kwargs = self._pre_call(prompt_kwargs, model_kwargs)
-        log.debug(f"api_kwargs: {api_kwargs}")
+        if debug_enabled:
+            log.debug(f"api_kwargs: {_json_dumps(api_kwargs)}")
         output: GeneratorOutputType = None
         # call the model client
 
@@ -773,14 +927,162 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
             model_kwargs=model_kwargs,
         )
 
-        log.info(f"output: {output}")
+        if log.isEnabledFor(logging.INFO):
+            log.info(f"output: {output}")
         return output
 
+    def call_many(
+        self,
+        prompt_kwargs_list: List[Dict],
+        model_kwargs: Optional[Dict] = None,
+        marshal_size: int = 4,
+        use_cache: Optional[bool] = None,
+    ) -> List[GeneratorOutputType]:
+        r"""Call the model for a list of prompt_kwargs, packing ``marshal_size`` prompts in each request.
+
+        The rendered prompts are numbered and concatenated using ``MARSHALED_PROMPTS_TEMPLATE``, and the model is asked to
+        respond with a JSON list of the answers. Each answer is processed by the output_processors as its own output.
+        It saves requests per minute when the token per minute limit still has room.
+        When the response can not be split into the expected number of answers, the prompts of that request are sent one by one.
+        When the request itself fails, e.g. it is rate limited, each output of that request has the error instead.
+        The ``max_tokens`` or ``max_completion_tokens`` of each request, passed or set by the client default, is multiplied
+        by the number of prompts in it, so pass the budget of a single answer.
+
+        Args:
+            prompt_kwargs_list (List[Dict]): The list of prompt_kwargs, one per prompt.
+            model_kwargs (Optional[Dict], optional): The model_kwargs shared by all requests. Defaults to None.
+            marshal_size (int, optional): The number of prompts per request, capped at ``MAX_MARSHAL_SIZE``. 1 means one request per prompt. Defaults to 4.
+            use_cache (Optional[bool], optional): Whether to use the cache. Defaults to None, using the generator setting.
+
+        Returns:
+            List[GeneratorOutputType]: The outputs in the same order as the prompt_kwargs_list.
+        """
+        model_kwargs = model_kwargs or {}
+        if marshal_size < 1:
+            raise ValueError(
+                f"marshal_size should be a positive integer, got {marshal_size}"
+            )
+        if marshal_size > MAX_MARSHAL_SIZE:
+            log.warning(
+                f"marshal_size {marshal_size} is capped at {MAX_MARSHAL_SIZE} to limit the latency of each request."
+            )
+            marshal_size = MAX_MARSHAL_SIZE
+        if marshal_size == 1 or self.mock_output:
+            return [
+                self.call(prompt_kwargs, model_kwargs, use_cache=use_cache)
+                for prompt_kwargs in prompt_kwargs_list
+            ]
+
+        outputs: List[GeneratorOutputType] = []
+        for i in range(0, len(prompt_kwargs_list), marshal_size):
+            chunk = prompt_kwargs_list[i : i + marshal_size]
+            if len(chunk) == 1:
+                outputs.append(self.call(chunk[0], model_kwargs, use_cache=use_cache))
+            else:
+                outputs.extend(self._call_marshaled(chunk, model_kwargs, use_cache))
+        return outputs
+
+    def _call_marshaled(
+        self,
+        prompt_kwargs_list: List[Dict],
+        model_kwargs: Dict,
+        use_cache: Optional[bool] = None,
+    ) -> List[GeneratorOutputType]:
+        r"""Send the prompts in one request and split the response into one output per prompt."""
+        prompt_strs = [
+            self._render_prompt(prompt_kwargs) for prompt_kwargs in prompt_kwargs_list
+        ]
+        marshaled_prompt_str = Prompt(
+            template=MARSHALED_PROMPTS_TEMPLATE,
+            prompt_kwargs={"prompts": prompt_strs},
+        )().strip()
+        api_kwargs = self.model_client.convert_inputs_to_api_kwargs(
+            input=marshaled_prompt_str,
+            model_kwargs=self._compose_model_kwargs(**model_kwargs),
+            model_type=self.model_type,
+        )
+        # the completion budget is set for one answer, including the client default, scale it to all the answers
+        api_kwargs = {
+            key: (
+                value * len(prompt_kwargs_list)
+                if key in ("max_tokens", "max_completion_tokens")
+                and isinstance(value, int)
+                else value
+            )
+            for key, value in api_kwargs.items()
+        }
+        use_cache = use_cache if use_cache is not None else self._use_cache
+
+        try:
+            completion = self._model_client_call(
+                api_kwargs=api_kwargs, use_cache=use_cache
+            )
+        except Exception as e:
+            # retrying the prompts one by one would only send more requests to a failing or rate limited endpoint
+            log.error(f"Error calling the model with marshaled prompts: {e}")
+            outputs = [GeneratorOutput(error=str(e)) for _ in prompt_kwargs_list]
+            self._run_marshaled_callbacks(
+                outputs, api_kwargs, prompt_kwargs_list, model_kwargs
+            )
+            return outputs
+
+        answers = None
+        try:
+            raw_response = self.model_client.parse_chat_completion(
+                completion
+            ).raw_response
+            answers = parse_json_str_to_obj(extract_json_str(str(raw_response)))
+        except Exception as e:
+            log.error(f"Error parsing the response of marshaled prompts: {e}")
+
+        if not isinstance(answers, list) or len(answers) != len(prompt_kwargs_list):
+            log.warning(
+                f"Failed to split the response into {len(prompt_kwargs_list)} answers, calling the prompts one by one."
+            )
+            return [
+                self.call(prompt_kwargs, model_kwargs, use_cache=use_cache)
+                for prompt_kwargs in prompt_kwargs_list
+            ]
+
+        outputs: List[GeneratorOutputType] = [
+            self._apply_output_processors(
+                # keep structured answers as JSON for the output processors and the traces
+                GeneratorOutput(
+                    raw_response=(
+                        answer
+                        if isinstance(answer, str)
+                        else json.dumps(answer, default=str)
+                    )
+                )
+            )
+            for answer in answers
+        ]
+        self._run_marshaled_callbacks(
+            outputs, api_kwargs, prompt_kwargs_list, model_kwargs
+        )
+        return outputs
+
+    def _run_marshaled_callbacks(
+        self,
+        outputs: List[GeneratorOutputType],
+        api_kwargs: Dict,
+        prompt_kwargs_list: List[Dict],
+        model_kwargs: Dict,
+    ):
+        r"""Trigger the callbacks once per prompt, all sharing the api_kwargs of the marshaled request."""
+        for output, prompt_kwargs in zip(outputs, prompt_kwargs_list):
+            self._run_callbacks(
+                output,
+                input=api_kwargs,
+                prompt_kwargs=prompt_kwargs,
+                model_kwargs=model_kwargs,
+            )
+
     # TODO: training is not supported in async call yet
     async def acall(
         self,
-        prompt_kwargs: Optional[Dict] = {},
-        model_kwargs: Optional[Dict] = {},
+        prompt_kwargs: Optional[Dict] = None,
+        model_kwargs: Optional[Dict] = None,
         use_cache: Optional[bool] = None,
         id: Optional[str] = None,
     ) -> GeneratorOutputType:
@@ -789,8 +1091,12 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         :warning::
             Training is not supported in async call yet.
         """
-        log.info(f"prompt_kwargs: {prompt_kwargs}")
-        log.info(f"model_kwargs: {model_kwargs}")
+        prompt_kwargs = prompt_kwargs or {}
+        model_kwargs = model_kwargs or {}
+        info_enabled = log.isEnabledFor(logging.INFO)
+        if info_enabled:
+            log.info(f"prompt_kwargs: {_json_dumps(prompt_kwargs)}")
+            log.info(f"model_kwargs: {_json_dumps(model_kwargs)}")
 
         api_kwargs = self._pre_call(prompt_kwargs, model_kwargs)
         output: GeneratorOutputType = None
@@ -798,6 +1104,8 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         completion = None
 
         try:
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire(self._estimate_num_tokens(api_kwargs))
             completion = await self.model_client.acall(
                 api_kwargs=api_kwargs, model_type=self.model_type
             )
@@ -812,7 +1120,8 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
                 log.error(f"Error processing the output: {e}")
                 output = GeneratorOutput(raw_response=str(completion), error=str(e))
 
-        log.info(f"output: {output}")
+        if info_enabled:
+            log.info(f"output: {output}")
         self._run_callbacks(
             output,
             input=api_kwargs,
@@ -821,6 +1130,164 @@ class Generator(GradComponent, CachedEngine, CallbackManager):
         )
         return output
 
+    def stream(
+        self,
+        prompt_kwargs: Optional[Dict] = None,
+        model_kwargs: Optional[Dict] = None,
+        id: Optional[str] = None,
+    ) -> Iterator[str]:
+        r"""Call the model with ``stream=True`` and yield the text deltas as they arrive.
+
+        The deltas are accumulated and the output_processors run once on the full text at the end.
+        The final ``GeneratorOutput`` is passed to the callbacks and is the return value of the iterator.
+
+        Example:
+
+        .. code-block:: python
+
+            for delta in generator.stream(prompt_kwargs={"input_str": "Hello"}):
+                print(delta, end="")
+        """
+        prompt_kwargs = prompt_kwargs or {}
+        model_kwargs = {**(model_kwargs or {}), "stream": True}
+        if self.mock_output:
+            yield self.mock_output_data
+            return GeneratorOutput(data=self.mock_output_data, id=id)
+
+        api_kwargs = self._pre_call(prompt_kwargs, model_kwargs)
+        output: GeneratorOutputType = None
+        parts: List[str] = []
+        try:
+            completion = self._model_client_call(api_kwargs=api_kwargs)
+            deltas = self._parse_stream_deltas(completion)
+            if isinstance(deltas, str):  # the model client does not stream
+                deltas = [deltas]
+            for chunk in deltas:
+                delta = self._get_delta_str(chunk)
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            log.error(f"Error streaming the model: {e}")
+            output = GeneratorOutput(raw_response="".join(parts), error=str(e))
+
+        if output is None:
+            output = self._post_call_streaming(parts)
+        output.id = id
+        self._run_callbacks(
+            output,
+            input=api_kwargs,
+            prompt_kwargs=prompt_kwargs,
+            model_kwargs=model_kwargs,
+        )
+        return output
+
+    async def astream(
+        self,
+        prompt_kwargs: Optional[Dict] = None,
+        model_kwargs: Optional[Dict] = None,
+        id: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        r"""Async version of :meth:`stream`. The final ``GeneratorOutput`` is only passed to the callbacks.
+
+        :warning::
+            Training is not supported in async call yet.
+        """
+        prompt_kwargs = prompt_kwargs or {}
+        model_kwargs = {**(model_kwargs or {}), "stream": True}
+        if self.mock_output:
+            yield self.mock_output_data
+            return
+
+        api_kwargs = self._pre_call(prompt_kwargs, model_kwargs)
+        output: GeneratorOutputType = None
+        parts: List[str] = []
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire(self._estimate_num_tokens(api_kwargs))
+            completion = await self.model_client.acall(
+                api_kwargs=api_kwargs, model_type=self.model_type
+            )
+            deltas = self._parse_stream_deltas(completion)
+            if isinstance(deltas, str):  # the model client does not stream
+                deltas = [deltas]
+            if hasattr(deltas, "__aiter__"):
+                async for chunk in deltas:
+                    delta = self._get_delta_str(chunk)
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+            else:
+                for chunk in deltas:
+                    delta = self._get_delta_str(chunk)
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+        except Exception as e:
+            log.error(f"Error streaming the model: {e}")
+            output = GeneratorOutput(raw_response="".join(parts), error=str(e))
+
+        if output is None:
+            output = self._post_call_streaming(parts)
+        output.id = id
+        self._run_callbacks(
+            output,
+            input=api_kwargs,
+            prompt_kwargs=prompt_kwargs,
+            model_kwargs=model_kwargs,
+        )
+
+    async def abatch(
+        self,
+        prompt_kwargs_list: List[Dict],
+        model_kwargs: Optional[Dict] = None,
+        max_concurrency: int = 10,
+    ) -> List[Union[GeneratorOutputType, Exception]]:
+        r"""Async call the model for a batch of prompt_kwargs with bounded concurrency.
+
+        Each item in ``prompt_kwargs_list`` is sent via :meth:`acall`, at most
+        ``max_concurrency`` requests are in flight at the same time. The outputs are returned in
+        the same order as the inputs. A failure in one call does not cancel the rest of the batch,
+        the exception is returned in its place.
+
+        Args:
+            prompt_kwargs_list (List[Dict]): The list of prompt_kwargs, one per call.
+            model_kwargs (Optional[Dict], optional): The model_kwargs shared by all calls. Defaults to None.
+            max_concurrency (int, optional): The maximum number of concurrent calls. Defaults to 10.
+
+        Note:
+            Tune ``max_concurrency`` to what your provider allows, similar to ``llm_model_max_async`` in other RAG libraries.
+            Higher values improve the throughput of network-bound workloads until you hit the rate limit of your API key.
+
+        Example:
+
+        .. code-block:: python
+
+            outputs = asyncio.run(
+                generator.abatch(
+                    [{"input_str": "Hello"}, {"input_str": "World"}], max_concurrency=4
+                )
+            )
+
+        :warning::
+            Training is not supported in async call yet.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency should be a positive integer, got {max_concurrency}"
+            )
+        model_kwargs = model_kwargs or {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _acall_with_semaphore(prompt_kwargs: Dict) -> GeneratorOutputType:
+            async with semaphore:
+                return await self.acall(prompt_kwargs, model_kwargs)
+
+        tasks = [
+            _acall_with_semaphore(prompt_kwargs) for prompt_kwargs in prompt_kwargs_list
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
     def __call__(self, *args, **kwargs) -> Union[GeneratorOutputType, Any]:
         if self.training:
             log.debug("Training mode")
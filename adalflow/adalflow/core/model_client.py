@@ -85,6 +85,9 @@ Check the subclasses in `components/model_client/` directory for the functional
             model_kwargs (Dict): model kwargs
             model_type (ModelType): model type
 
+        Note:
+            The model_kwargs should not be modified in place, copy it before adding the input, e.g. ``final_model_kwargs = model_kwargs.copy()``.
+            The Generator passes its default model_kwargs directly when there is no per-call override.
         """
         raise NotImplementedError(
             f"{type(self).__name__} must implement _combine_input_and_model_kwargs method"
@@ -1,6 +1,6 @@
 """Class prompt builder for LightRAG system prompt."""
 
-from typing import Dict, Any, Optional, List, TypeVar
+from typing import Dict, Any, Optional, List, TypeVar, FrozenSet
 import logging
 from functools import lru_cache
 
@@ -52,7 +52,7 @@ class Prompt(Component):
     def __init__(
         self,
         template: Optional[str] = None,
-        prompt_kwargs: Optional[Dict[str, Parameter]] = {},
+        prompt_kwargs: Optional[Dict[str, Parameter]] = None,
     ):
         super().__init__()
 
@@ -64,14 +64,13 @@ class Prompt(Component):
 
         logger.info(f"{__class__.__name__} has variables: {self.prompt_variables}")
 
-        self.prompt_kwargs = prompt_kwargs
+        # a fresh dict per prompt, update_prompt_kwargs updates it in place
+        self.prompt_kwargs = prompt_kwargs if prompt_kwargs is not None else {}
 
     def __create_jinja2_template(self):
         r"""Create the Jinja2 template object."""
         try:
-            self.jinja2_template: Template = get_jinja2_environment().from_string(
-                self.template
-            )
+            self.jinja2_template: Template = get_jinja2_template(self.template)
         except Exception as e:
             raise ValueError(f"Invalid Jinja2 template: {e}")
 
@@ -89,8 +88,7 @@ class Prompt(Component):
 
     def _find_template_variables(self, template_str: str):
         """Automatically find all the variables in the template."""
-        parsed_content = self.jinja2_template.environment.parse(template_str)
-        return meta.find_undeclared_variables(parsed_content)
+        return find_template_variables(template_str)
 
     def compose_prompt_kwargs(self, **kwargs) -> Dict:
         r"""Compose the final prompt kwargs by combining the initial and the provided kwargs at runtime."""
@@ -151,7 +149,7 @@ class Prompt(Component):
     def from_dict(cls: type[T], data: Dict[str, Any]) -> T:
         obj = super().from_dict(data)
         # recreate the jinja2 template
-        obj.jinja2_template = get_jinja2_environment().from_string(obj.template)
+        obj.jinja2_template = get_jinja2_template(obj.template)
         return obj
 
     def to_dict(self) -> Dict[str, Any]:
@@ -192,3 +190,16 @@ def get_jinja2_environment():
         return default_environment
     except Exception as e:
         raise ValueError(f"Invalid Jinja2 environment: {e}")
+
+
+@lru_cache(maxsize=128)
+def get_jinja2_template(template: str) -> Template:
+    r"""Helper function to compile a template string once and share the Template object across Prompt instances."""
+    return get_jinja2_environment().from_string(template)
+
+
+@lru_cache(maxsize=128)
+def find_template_variables(template: str) -> FrozenSet[str]:
+    r"""Helper function to find the undeclared variables of a template string, parsed once per template."""
+    parsed_content = get_jinja2_environment().parse(template)
+    return frozenset(meta.find_undeclared_variables(parsed_content))
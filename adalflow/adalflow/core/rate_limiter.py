@@ -0,0 +1,130 @@
+r"""Proactive client-side rate limiting for model client calls."""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+import logging
+
+log = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    r"""A token bucket that refills continuously at ``capacity`` per minute.
+
+    The bucket is refilled lazily from the monotonic clock at each access, so no background timer is needed.
+    """
+
+    def __init__(self, capacity_per_minute: float):
+        if capacity_per_minute <= 0:
+            raise ValueError(
+                f"capacity_per_minute should be positive, got {capacity_per_minute}"
+            )
+        self.capacity = float(capacity_per_minute)
+        self.refill_rate = self.capacity / 60.0  # per second
+        self.available = self.capacity
+        self.last_update = time.monotonic()
+
+    def refill(self, now: float):
+        elapsed = now - self.last_update
+        self.available = min(self.capacity, self.available + elapsed * self.refill_rate)
+        self.last_update = now
+
+    def wait_time(self, amount: float) -> float:
+        r"""Seconds to wait until ``amount`` is available. Assumes the bucket is refilled."""
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.refill_rate
+
+    def consume(self, amount: float):
+        self.available -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    __doc__ = r"""Throttle the model calls before they are sent to stay under the provider's rate limits.
+
+    It keeps two token buckets, one for requests per minute(rpm) and one for tokens per minute(tpm),
+    similar to the ``api_request_parallel_processor`` in the openai-cookbook.
+    Each call waits until both buckets have enough capacity, instead of hitting a 429 error and relying on retries.
+
+    The same limiter can be shared across multiple generators and both sync and async calls.
+
+    Args:
+        rpm (Optional[float], optional): The maximum requests per minute. Defaults to None, no limit on requests.
+        tpm (Optional[float], optional): The maximum tokens per minute. Defaults to None, no limit on tokens.
+
+    Example:
+
+    .. code-block:: python
+
+        from adalflow.core.rate_limiter import RateLimiter
+
+        rate_limiter = RateLimiter(rpm=500, tpm=200_000)
+        generator = Generator(
+            model_client=OpenAIClient(),
+            model_kwargs={"model": "gpt-3.5-turbo"},
+            rate_limiter=rate_limiter,
+        )
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        if rpm is None and tpm is None:
+            raise ValueError("At least one of rpm and tpm should be set.")
+        self.rpm = rpm
+        self.tpm = tpm
+        self._request_bucket = _TokenBucket(rpm) if rpm is not None else None
+        self._token_bucket = _TokenBucket(tpm) if tpm is not None else None
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, num_tokens: int) -> float:
+        r"""Consume the capacity if both buckets have enough, otherwise return the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = 0.0
+            for bucket, amount in (
+                (self._request_bucket, 1),
+                (self._token_bucket, num_tokens),
+            ):
+                if bucket is not None:
+                    bucket.refill(now)
+                    wait_time = max(wait_time, bucket.wait_time(amount))
+            if wait_time > 0:
+                return wait_time
+            if self._request_bucket is not None:
+                self._request_bucket.consume(1)
+            if self._token_bucket is not None:
+                self._token_bucket.consume(num_tokens)
+            return 0.0
+
+    def acquire(self, num_tokens: int = 0):
+        r"""Block until a request of ``num_tokens`` estimated tokens can be sent."""
+        while True:
+            wait_time = self._try_acquire(num_tokens)
+            if wait_time <= 0:
+                return
+            log.debug(f"Rate limit reached, waiting for {wait_time:.2f} seconds.")
+            time.sleep(wait_time)
+
+    async def aacquire(self, num_tokens: int = 0):
+        r"""Async version of :meth:`acquire`, it yields to the event loop while waiting."""
+        while True:
+            wait_time = self._try_acquire(num_tokens)
+            if wait_time <= 0:
+                return
+            log.debug(f"Rate limit reached, waiting for {wait_time:.2f} seconds.")
+            await asyncio.sleep(wait_time)
+
+    def __getstate__(self):
+        # Remove the lock from the state before pickling
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        # Restore the lock after unpickling
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rpm={self.rpm}, tpm={self.tpm})"
@@ -0,0 +1,98 @@
+import unittest
+import heapq
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from adalflow.components.retriever.bm25_retriever import BM25Retriever
+
+
+def reference_scores(retriever: BM25Retriever, query: str):
+    r"""The per-term BM25 formula, used to check the optimized scoring."""
+    tokens = retriever._split_function(query)
+    doc_len = np.array(retriever.doc_len)
+    score = np.zeros(retriever.total_documents)
+    for q in tokens:
+        q_freq = np.array([doc.get(q, 0) for doc in retriever.t2d])
+        score += retriever.idf.get(q, 0) * (
+            q_freq
+            * (retriever.k1 + 1)
+            / (
+                q_freq
+                + retriever.k1
+                * (1 - retriever.b + retriever.b * doc_len / retriever.avgdl)
+            )
+        )
+    return score.tolist()
+
+
+class TestBM25Retriever(unittest.TestCase):
+    def setUp(self):
+        self.documents = [
+            "hello world",
+            "world is beautiful",
+            "today is a good day",
+            "the weather is good today and the world is beautiful",
+            "hello hello again",
+        ]
+        self.retriever = BM25Retriever(
+            top_k=2, documents=self.documents, use_tokenizer=False
+        )
+
+    def test_scores_match_reference(self):
+        for query in ["hello world", "good day today", "world world is", "unknown"]:
+            np.testing.assert_allclose(
+                self.retriever._get_scores(self.retriever._split_function(query)),
+                reference_scores(self.retriever, query),
+            )
+
+    def test_retrieve_top_k(self):
+        output = self.retriever("hello")
+        self.assertEqual(len(output), 1)
+        self.assertEqual(output[0].doc_indices[0], 4)
+        self.assertEqual(len(output[0].doc_indices), 2)
+        self.assertEqual(output[0].query, "hello")
+
+    def test_top_k_matches_heapq(self):
+        scores = np.array([0.5, 1.0, 0.5, 0.0, 1.0, 0.5])
+        for top_k in range(0, len(scores) + 2):
+            expected = heapq.nlargest(top_k, range(len(scores)), scores.__getitem__)
+            self.assertEqual(BM25Retriever._get_top_k(scores, top_k).tolist(), expected)
+
+    def test_retrieve_multiple_queries(self):
+        output = self.retriever(["hello", "good day"], top_k=1)
+        self.assertEqual([o.doc_indices for o in output], [[4], [2]])
+
+    def test_scores_match_reference_random_corpus(self):
+        rng = random.Random(0)
+        words = [f"w{i}" for i in range(50)]
+        documents = [
+            " ".join(rng.choices(words, k=rng.randint(1, 30))) for _ in range(100)
+        ]
+        retriever = BM25Retriever(documents=documents, use_tokenizer=False)
+        for _ in range(10):
+            query = " ".join(rng.choices(words + ["unknown"], k=5))
+            np.testing.assert_allclose(
+                retriever._get_scores(retriever._split_function(query)),
+                reference_scores(retriever, query),
+            )
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "bm25_index.json")
+            self.retriever.save_to_file(path)
+            loaded = BM25Retriever.load_from_file(path)
+        self.assertFalse(loaded._use_tokenizer)
+        for query in ["hello world", "good day today"]:
+            self.assertEqual(loaded(query), self.retriever(query))
+
+    def test_retrieve_without_index(self):
+        retriever = BM25Retriever(use_tokenizer=False)
+        with self.assertRaises(ValueError):
+            retriever("hello")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from adalflow.core.types import Document, RetrieverOutput
+from adalflow.components.data_process.data_components import (
+    RetrieverOutputToContextStr,
+)
+
+
+class TestRetrieverOutputToContextStr(unittest.TestCase):
+    def setUp(self):
+        self.doc_a = Document(text="hello", id="a")
+        self.doc_b = Document(text="world", id="b")
+        self.outputs = [
+            RetrieverOutput(doc_indices=[0, 1], documents=[self.doc_a, self.doc_b]),
+            RetrieverOutput(doc_indices=[1, 0], documents=[self.doc_b, self.doc_a]),
+        ]
+
+    def test_single_output(self):
+        to_str = RetrieverOutputToContextStr()
+        self.assertEqual(to_str(self.outputs[0]), "hello world")
+
+    def test_multiple_outputs(self):
+        to_str = RetrieverOutputToContextStr()
+        self.assertEqual(to_str(self.outputs), "hello world world hello")
+
+    def test_deduplicate(self):
+        to_str = RetrieverOutputToContextStr(deduplicate=True)
+        self.assertEqual(to_str(self.outputs), "hello world")
+
+
+if __name__ == "__main__":
+    unittest.main()
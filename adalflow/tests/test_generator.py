@@ -3,16 +3,24 @@ from unittest.mock import patch, Mock
 import unittest
 import os
 import shutil
+import asyncio
+
+from jinja2 import Template
 
 from openai.types import CompletionUsage
 from openai.types.chat import ChatCompletion
 
 from adalflow.core.types import GeneratorOutput
-from adalflow.core.generator import Generator
+from adalflow.core.generator import (
+    Generator,
+    _render_prompt_cached,
+)
+from adalflow.core.rate_limiter import RateLimiter
 
 
 from adalflow.core.model_client import ModelClient
 from adalflow.components.model_client.groq_client import GroqAPIClient
+from adalflow.components.model_client.openai_client import OpenAIClient
 from adalflow.tracing import GeneratorStateLogger
 
 
@@ -108,6 +116,313 @@ class TestGenerator(IsolatedAsyncioTestCase):
         )
         self._clean_up()
 
+    async def test_generator_abatch(self):
+        in_flight, max_in_flight = 0, 0
+
+        async def mock_acall(api_kwargs, model_type):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return api_kwargs["input"]
+
+        self.mock_api_client.acall.side_effect = mock_acall
+        self.mock_api_client.convert_inputs_to_api_kwargs.side_effect = (
+            lambda input, model_kwargs, model_type: {"input": input}
+        )
+        self.mock_api_client.parse_chat_completion.side_effect = (
+            lambda completion: GeneratorOutput(raw_response=completion)
+        )
+        generator = Generator(
+            model_client=self.mock_api_client, template="{{ input_str }}"
+        )
+        prompt_kwargs_list = [{"input_str": f"query {i}"} for i in range(5)]
+
+        outputs = await generator.abatch(prompt_kwargs_list, max_concurrency=2)
+
+        self.assertEqual(
+            [output.data for output in outputs], [f"query {i}" for i in range(5)]
+        )
+        self.assertLessEqual(max_in_flight, 2)
+
+    def test_generator_call_with_rate_limiter(self):
+        rate_limiter = RateLimiter(rpm=60)
+        self.mock_api_client.convert_inputs_to_api_kwargs.return_value = {
+            "input": "Hello, world!"
+        }
+        generator = Generator(
+            model_client=self.mock_api_client, rate_limiter=rate_limiter
+        )
+        with patch.object(
+            rate_limiter, "acquire", wraps=rate_limiter.acquire
+        ) as mock_acquire:
+            generator.call(prompt_kwargs={"input_str": "Hello, world!"})
+        mock_acquire.assert_called_once()
+        # 13 chars of prompt and the default 256 completion tokens
+        self.assertEqual(mock_acquire.call_args.args[0], 13 // 4 + 256)
+
+    def test_generator_estimate_num_tokens(self):
+        # counted from the prompt text, non-ASCII characters are not escaped
+        prompt = "你好" * 200
+        api_kwargs = {
+            "model": "gpt-3.5-turbo",
+            "messages": [{"role": "system", "content": prompt}],
+            "max_tokens": 100,
+        }
+        self.assertEqual(Generator._estimate_num_tokens(api_kwargs), 100 + 100)
+        api_kwargs["messages"] = [
+            {"role": "user", "content": [{"type": "text", "text": prompt}]}
+        ]
+        self.assertEqual(Generator._estimate_num_tokens(api_kwargs), 100 + 100)
+        self.assertEqual(Generator._estimate_num_tokens({"prompt": "a" * 40}), 10 + 256)
+
+    def test_generator_render_prompt_cache(self):
+        generator = Generator(
+            model_client=self.mock_api_client, template="\n Hello, {{ input_str }}!\n"
+        )
+        _render_prompt_cached.cache_clear()
+        for _ in range(3):
+            prompt_str = generator._render_prompt({"input_str": "world"})
+        self.assertEqual(prompt_str, "Hello, world!")
+        self.assertEqual(_render_prompt_cached.cache_info().hits, 2)
+        # unhashable values fall back to the uncached rendering
+        prompt_str = generator._render_prompt({"input_str": ["world"]})
+        self.assertEqual(prompt_str, "Hello, ['world']!")
+
+    def test_generator_render_prompt_mutable_value(self):
+        class Name:
+            def __init__(self, name):
+                self.name = name
+
+            def __str__(self):
+                return self.name
+
+        generator = Generator(
+            model_client=self.mock_api_client, template="{{ input_str }}"
+        )
+        name = Name("a")
+        self.assertEqual(generator._render_prompt({"input_str": name}), "a")
+        # hashable objects can change after they are hashed, they are not cached
+        name.name = "b"
+        self.assertEqual(generator._render_prompt({"input_str": name}), "b")
+
+    def test_generator_render_prompt_equal_values_of_different_types(self):
+        generator = Generator(
+            model_client=self.mock_api_client, template="Value: {{x}}"
+        )
+        _render_prompt_cached.cache_clear()
+        # 1, True and 1.0 are equal and hash the same, but render differently
+        for value in [1, True, 1.0, 0, False, 0.0, -0.0]:
+            self.assertEqual(
+                generator._render_prompt({"x": value}), generator.prompt.call(x=value)
+            )
+
+    def test_generator_render_prompt_uses_prompt_template(self):
+        generator = Generator(
+            model_client=self.mock_api_client, template="Hello, {{ input_str }}!"
+        )
+        generator.prompt.jinja2_template = Template("Hi, {{ input_str }}!")
+        self.assertEqual(
+            generator._render_prompt({"input_str": "world"}),
+            generator.prompt.call(input_str="world"),
+        )
+
+    def test_generator_call_without_cache_skips_serialization(self):
+        # api_kwargs only need to be JSON serializable when the cache is used
+        self.mock_api_client.convert_inputs_to_api_kwargs.return_value = {
+            "input": object()
+        }
+        self.mock_api_client.parse_chat_completion.return_value = GeneratorOutput(
+            raw_response="Generated text response"
+        )
+        output = self.generator.call(prompt_kwargs={"input_str": "Hello, world!"})
+        self.assertIsNone(output.error)
+        self.assertEqual(output.data, "Generated text response")
+
+    def test_generator_pre_call_model_kwargs(self):
+        generator = Generator(
+            model_client=self.mock_api_client, model_kwargs={"model": "gpt-3.5-turbo"}
+        )
+        convert = self.mock_api_client.convert_inputs_to_api_kwargs
+        # the default model_kwargs are passed as is without overrides
+        generator._pre_call(prompt_kwargs={}, model_kwargs={})
+        self.assertIs(convert.call_args.kwargs["model_kwargs"], generator.model_kwargs)
+        generator._pre_call(prompt_kwargs={}, model_kwargs={"temperature": 0.5})
+        self.assertEqual(
+            convert.call_args.kwargs["model_kwargs"],
+            {"model": "gpt-3.5-turbo", "temperature": 0.5},
+        )
+        self.assertEqual(generator.model_kwargs, {"model": "gpt-3.5-turbo"})
+
+    def test_generator_compose_model_kwargs(self):
+        generator = Generator(
+            model_client=self.mock_api_client, model_kwargs={"model": "gpt-3.5-turbo"}
+        )
+        # equal values of different types are kept as passed
+        for temperature in [1, 1.0, True]:
+            model_kwargs = generator._compose_model_kwargs(temperature=temperature)
+            self.assertIs(type(model_kwargs["temperature"]), type(temperature))
+        model_kwargs = generator._compose_model_kwargs(stop=["\n"])
+        self.assertEqual(model_kwargs, {"model": "gpt-3.5-turbo", "stop": ["\n"]})
+        self.assertEqual(generator.model_kwargs, {"model": "gpt-3.5-turbo"})
+
+    def test_generator_default_kwargs_not_shared(self):
+        generator_a = Generator(model_client=self.mock_api_client)
+        generator_b = Generator(model_client=self.mock_api_client)
+        generator_a.prompt.update_prompt_kwargs(task_desc_str="a")
+        self.assertEqual(generator_b.prompt.prompt_kwargs, {})
+        self.assertIsNot(generator_a.model_kwargs, generator_b.model_kwargs)
+        output = generator_a.call()
+        self.assertIsInstance(output, GeneratorOutput)
+
+    def test_generator_stream(self):
+        self.mock_api_client.convert_inputs_to_api_kwargs.side_effect = (
+            lambda input, model_kwargs, model_type: {**model_kwargs, "input": input}
+        )
+        self.mock_api_client.parse_chat_completion.side_effect = (
+            lambda completion: GeneratorOutput(raw_response=iter(completion))
+        )
+        self.mock_api_client.call.return_value = ["Hello", None, ", world!"]
+        outputs = []
+        generator = Generator(model_client=self.mock_api_client)
+        generator.register_callback(
+            "on_complete", lambda output, **kwargs: outputs.append(output)
+        )
+
+        deltas = list(generator.stream(prompt_kwargs={"input_str": "Hi"}))
+
+        self.assertEqual(deltas, ["Hello", ", world!"])
+        api_kwargs = self.mock_api_client.call.call_args.kwargs["api_kwargs"]
+        self.assertTrue(api_kwargs["stream"])
+        self.assertEqual(outputs[0].raw_response, "Hello, world!")
+        self.assertEqual(outputs[0].data, "Hello, world!")
+
+    async def test_generator_astream(self):
+        async def mock_deltas():
+            for delta in ["Hello", ", world!"]:
+                yield delta
+
+        self.mock_api_client.convert_inputs_to_api_kwargs.side_effect = (
+            lambda input, model_kwargs, model_type: {**model_kwargs, "input": input}
+        )
+        self.mock_api_client.parse_chat_completion.side_effect = (
+            lambda completion: GeneratorOutput(raw_response=mock_deltas())
+        )
+        outputs = []
+        generator = Generator(model_client=self.mock_api_client)
+        generator.register_callback(
+            "on_complete", lambda output, **kwargs: outputs.append(output)
+        )
+
+        deltas = [
+            delta
+            async for delta in generator.astream(prompt_kwargs={"input_str": "Hi"})
+        ]
+
+        self.assertEqual(deltas, ["Hello", ", world!"])
+        self.assertEqual(outputs[0].data, "Hello, world!")
+
+    def test_generator_call_many(self):
+        self.mock_api_client.convert_inputs_to_api_kwargs.side_effect = (
+            lambda input, model_kwargs, model_type: {"input": input}
+        )
+        self.mock_api_client.call.side_effect = lambda api_kwargs, model_type: (
+            '["answer 1", "answer 2"]'
+            if "### Prompt 2" in api_kwargs["input"]
+            else "single answer"
+        )
+        self.mock_api_client.parse_chat_completion.side_effect = (
+            lambda completion: GeneratorOutput(raw_response=completion)
+        )
+        generator = Generator(
+            model_client=self.mock_api_client, template="{{ input_str }}"
+        )
+        prompt_kwargs_list = [{"input_str": f"query {i}"} for i in range(3)]
+
+        outputs = generator.call_many(prompt_kwargs_list, marshal_size=2)
+
+        self.assertEqual(
+            [output.data for output in outputs],
+            ["answer 1", "answer 2", "single answer"],
+        )
+        # 1 request for the first two prompts and 1 for the last one
+        self.assertEqual(self.mock_api_client.call.call_count, 2)
+        first_input = self.mock_api_client.call.call_args_list[0].kwargs["api_kwargs"][
+            "input"
+        ]
+        self.assertIn("### Prompt 1\nquery 0", first_input)
+        self.assertIn("### Prompt 2\nquery 1", first_input)
+
+    def _set_up_call_many(self, call_side_effect):
+        self.mock_api_client.convert_inputs_to_api_kwargs.side_effect = (
+            lambda input, model_kwargs, model_type: {"input": input}
+        )
+        self.mock_api_client.call.side_effect = call_side_effect
+        self.mock_api_client.parse_chat_completion.side_effect = (
+            lambda completion: GeneratorOutput(raw_response=completion)
+        )
+        return Generator(model_client=self.mock_api_client, template="{{ input_str }}")
+
+    def test_generator_call_many_model_error(self):
+        def rate_limited(api_kwargs, model_type):
+            raise Exception("rate limited")
+
+        generator = self._set_up_call_many(rate_limited)
+        prompt_kwargs_list = [{"input_str": f"query {i}"} for i in range(2)]
+        outputs = generator.call_many(prompt_kwargs_list, marshal_size=2)
+        # no fallback to one request per prompt
+        self.assertEqual(self.mock_api_client.call.call_count, 1)
+        self.assertEqual([output.error for output in outputs], ["rate limited"] * 2)
+
+    def test_generator_call_many_unsplittable_response(self):
+        generator = self._set_up_call_many(lambda api_kwargs, model_type: "not a list")
+        prompt_kwargs_list = [{"input_str": f"query {i}"} for i in range(2)]
+        outputs = generator.call_many(prompt_kwargs_list, marshal_size=2)
+        # 1 marshaled request and 1 request per prompt
+        self.assertEqual(self.mock_api_client.call.call_count, 3)
+        self.assertEqual([output.data for output in outputs], ["not a list"] * 2)
+
+    def test_generator_call_many_structured_answers(self):
+        generator = self._set_up_call_many(
+            lambda api_kwargs, model_type: '[{"answer": "Paris"}, "Berlin"]'
+        )
+        prompt_kwargs_list = [{"input_str": f"query {i}"} for i in range(2)]
+        outputs = generator.call_many(prompt_kwargs_list, marshal_size=2)
+        self.assertEqual(
+            [output.raw_response for output in outputs],
+            ['{"answer": "Paris"}', "Berlin"],
+        )
+
+    def test_generator_call_many_scales_max_tokens(self):
+        client = OpenAIClient(api_key="fake_api_key")
+        sent_api_kwargs = []
+
+        def call(api_kwargs, model_type):
+            sent_api_kwargs.append(api_kwargs)
+            return "[" + ", ".join(['"answer"'] * 8) + "]"
+
+        with patch.object(client, "call", side_effect=call), patch.object(
+            client,
+            "parse_chat_completion",
+            side_effect=lambda completion: GeneratorOutput(raw_response=completion),
+        ):
+            generator = Generator(
+                model_client=client,
+                model_kwargs={"model": "gpt-3.5-turbo"},
+                template="{{ input_str }}",
+            )
+            prompt_kwargs_list = [{"input_str": f"query {i}"} for i in range(8)]
+            # the client default budget is for one answer
+            generator.call_many(prompt_kwargs_list, marshal_size=8)
+            generator.call_many(
+                prompt_kwargs_list, model_kwargs={"max_tokens": 100}, marshal_size=8
+            )
+        self.assertEqual(
+            [api_kwargs["max_tokens"] for api_kwargs in sent_api_kwargs],
+            [512 * 8, 100 * 8],
+        )
+
 
 def getenv_side_effect(key):
     # This dictionary can hold more keys and values as needed
@@ -2,10 +2,15 @@ import unittest
 from unittest.mock import patch, AsyncMock, Mock
 
 from openai.types import CompletionUsage
-from openai.types.chat import ChatCompletion
+import httpx
+from openai import Stream, APIConnectionError, BadRequestError
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 
 from adalflow.core.types import ModelType, GeneratorOutput
-from adalflow.components.model_client.openai_client import OpenAIClient
+from adalflow.components.model_client.openai_client import (
+    OpenAIClient,
+    get_openai_client,
+)
 
 
 def getenv_side_effect(key):
@@ -98,6 +103,124 @@ class TestOpenAIClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(output.usage.prompt_tokens, 20)
         self.assertEqual(output.usage.total_tokens, 30)
 
+    def test_parse_streaming_completion(self):
+        chunks = [
+            ChatCompletionChunk(
+                id="chunk",
+                created=1635820005,
+                model="gpt-3.5-turbo",
+                object="chat.completion.chunk",
+                choices=[{"index": 0, "delta": {"content": content}}],
+            )
+            for content in ["Hello", ", world!"]
+        ]
+        stream = Mock(spec=Stream)
+        stream.__iter__ = Mock(return_value=iter(chunks))
+
+        output = self.client.parse_chat_completion(completion=stream)
+
+        self.assertIsNone(output.error)
+        self.assertEqual(list(output.raw_response), ["Hello", ", world!"])
+        # non-streaming completions still use the chat_completion_parser
+        output = self.client.parse_chat_completion(completion=self.mock_response)
+        self.assertEqual(output.raw_response, "Hello, world!")
+
+    def test_client_connection_settings(self):
+        client = OpenAIClient(
+            api_key="fake_api_key", pool_size=20, timeout=10.0, max_retries=3
+        )
+        self.assertEqual(client.sync_client.max_retries, 3)
+        self.assertEqual(client.sync_client.timeout.read, 10.0)
+        self.assertEqual(client.sync_client.timeout.connect, 5.0)
+
+        async_client = client.init_async_client()
+        self.assertEqual(async_client.max_retries, 3)
+        self.assertEqual(async_client.timeout.read, 10.0)
+        client.close()
+
+    def test_convert_inputs_to_api_kwargs_default_max_tokens(self):
+        api_kwargs = self.client.convert_inputs_to_api_kwargs(
+            input="Hello",
+            model_kwargs={"model": "gpt-3.5-turbo"},
+            model_type=ModelType.LLM,
+        )
+        self.assertEqual(api_kwargs["max_tokens"], 512)
+
+        api_kwargs = self.client.convert_inputs_to_api_kwargs(
+            input="Hello",
+            model_kwargs={"model": "gpt-3.5-turbo", "max_tokens": 1024},
+            model_type=ModelType.LLM,
+        )
+        self.assertEqual(api_kwargs["max_tokens"], 1024)
+
+        client = OpenAIClient(api_key="fake_api_key", max_tokens=None)
+        api_kwargs = client.convert_inputs_to_api_kwargs(
+            input="Hello",
+            model_kwargs={"model": "gpt-3.5-turbo"},
+            model_type=ModelType.LLM,
+        )
+        self.assertNotIn("max_tokens", api_kwargs)
+
+    def _call_with_transport(self, handler, max_retries: int = 3):
+        r"""Call through the real OpenAI SDK client and httpx, only the transport is mocked."""
+
+        class MockTransportClient(httpx.Client):
+            def __init__(self, **kwargs):
+                super().__init__(transport=httpx.MockTransport(handler), **kwargs)
+
+        with patch(
+            "adalflow.components.model_client.openai_client.httpx.Client",
+            MockTransportClient,
+        ), patch("openai._base_client.time.sleep"):
+            client = OpenAIClient(api_key="fake_api_key", max_retries=max_retries)
+            return client.call(api_kwargs=self.api_kwargs, model_type=ModelType.LLM)
+
+    def test_call_retries_transient_errors_once(self):
+        attempts = []
+
+        def connect_error(request):
+            attempts.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        with self.assertRaises(APIConnectionError):
+            self._call_with_transport(connect_error)
+        # one try and max_retries retries, without a second retry layer on top
+        self.assertEqual(len(attempts), 4)
+
+        attempts.clear()
+        responses = [
+            httpx.Response(429, json={"error": {"message": "rate limited"}}),
+            httpx.Response(200, json=self.mock_response.model_dump()),
+        ]
+
+        def rate_limited_then_ok(request):
+            attempts.append(request)
+            return responses[len(attempts) - 1]
+
+        result = self._call_with_transport(rate_limited_then_ok)
+        self.assertEqual(result.choices[0].message.content, "Hello, world!")
+        self.assertEqual(len(attempts), 2)
+
+    def test_call_does_not_retry_bad_request(self):
+        attempts = []
+
+        def bad_request(request):
+            attempts.append(request)
+            return httpx.Response(400, json={"error": {"message": "bad request"}})
+
+        with self.assertRaises(BadRequestError):
+            self._call_with_transport(bad_request)
+        self.assertEqual(len(attempts), 1)
+
+    def test_get_openai_client_is_shared(self):
+        get_openai_client.cache_clear()
+        client = get_openai_client(api_key="fake_api_key")
+        self.assertIs(get_openai_client(api_key="fake_api_key"), client)
+        self.assertIsNot(
+            get_openai_client(api_key="fake_api_key", timeout=10.0), client
+        )
+        get_openai_client.cache_clear()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from adalflow.core.prompt_builder import Prompt, find_template_variables
+
+
+class TestFindTemplateVariables(unittest.TestCase):
+    def setUp(self):
+        self.template = r"""{{ task_desc_str }}
+{% if context_str %}Context: {{ context_str }}{% endif %}
+{% for example in examples %}{{ example }}{% endfor %}
+User: {{ input_str }}"""
+        find_template_variables.cache_clear()
+
+    def test_find_template_variables(self):
+        self.assertEqual(
+            find_template_variables(self.template),
+            {"task_desc_str", "context_str", "examples", "input_str"},
+        )
+        # the loop variable is not a template variable
+        self.assertNotIn("example", find_template_variables(self.template))
+
+    def test_prompts_share_the_parsed_template(self):
+        prompt = Prompt(template=self.template)
+        self.assertEqual(find_template_variables.cache_info().misses, 1)
+        second_prompt = Prompt(template=self.template)
+        self.assertEqual(find_template_variables.cache_info().hits, 1)
+        self.assertEqual(
+            sorted(prompt.prompt_variables), sorted(second_prompt.prompt_variables)
+        )
+        self.assertEqual(
+            second_prompt.call(input_str="Hello", examples=[]).strip().splitlines()[-1],
+            "User: Hello",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import asyncio
+import pickle
+import time
+import unittest
+from unittest.mock import patch
+
+from adalflow.core.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_requires_a_limit(self):
+        with self.assertRaises(ValueError):
+            RateLimiter()
+
+    def test_acquire_within_capacity_does_not_wait(self):
+        rate_limiter = RateLimiter(rpm=60, tpm=1000)
+        with patch("adalflow.core.rate_limiter.time.sleep") as mock_sleep:
+            for _ in range(3):
+                rate_limiter.acquire(num_tokens=100)
+        mock_sleep.assert_not_called()
+
+    def test_acquire_waits_when_requests_exhausted(self):
+        # full bucket of 60 requests, refilled at 1 request per second
+        rate_limiter = RateLimiter(rpm=60)
+        for _ in range(60):
+            rate_limiter.acquire()
+        self.assertGreater(rate_limiter._try_acquire(0), 0.9)
+
+    def test_acquire_waits_when_tokens_exhausted(self):
+        rate_limiter = RateLimiter(tpm=600)
+        rate_limiter.acquire(num_tokens=600)
+        # 10 tokens per second
+        wait_time = rate_limiter._try_acquire(100)
+        self.assertAlmostEqual(wait_time, 10, delta=0.1)
+
+    def test_aacquire(self):
+        rate_limiter = RateLimiter(rpm=6000)
+        rate_limiter.acquire()
+        start = time.monotonic()
+        asyncio.run(rate_limiter.aacquire())
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_pickle(self):
+        rate_limiter = RateLimiter(rpm=60, tpm=1000)
+        restored = pickle.loads(pickle.dumps(rate_limiter))
+        self.assertEqual(restored.rpm, 60)
+        restored.acquire(num_tokens=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import pytest
 import unittest
+from unittest.mock import patch
 
 from adalflow.core.string_parser import (
     JsonParser,
@@ -13,6 +14,8 @@ from adalflow.core.functional import (
     fix_json_missing_commas,
     fix_json_escaped_single_quotes,
     extract_yaml_str,
+    parse_json_str_to_obj,
+    _json_dumps,
 )
 from adalflow.utils.logger import get_logger
 
@@ -178,6 +181,29 @@ def test_json_parser_escape_single_quotes():
     assert "Got invalid JSON object" in str(excinfo.value)
 
 
+def test_json_parser_control_characters_in_string():
+    # LLMs often put raw newlines inside the JSON strings
+    parser = JsonParser()
+    text = '{"answer": "line 1\nline 2"}'
+    assert parser(text) == {"answer": "line 1\nline 2"}
+
+
+def test_parse_json_str_to_obj_without_orjson():
+    with patch("adalflow.core.functional.orjson", None):
+        assert parse_json_str_to_obj('{"name": "John", "age": 30}') == {
+            "name": "John",
+            "age": 30,
+        }
+
+
+def test_json_dumps_for_logging():
+    obj = {"input_str": "Hello", 1: object}
+    with patch("adalflow.core.functional.orjson", None):
+        expected = _json_dumps(obj)
+    assert expected == '{"input_str": "Hello", "1": "<class \'object\'>"}'
+    assert _json_dumps(obj).replace(" ", "") == expected.replace(" ", "")
+
+
 class TestExtractYamlStr(unittest.TestCase):
 
     def test_extract_yaml_with_triple_backticks(self):
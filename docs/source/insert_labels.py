@@ -1,24 +1,36 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def _add_reference_label(filepath: str, module_label: str):
+    try:
+        path = Path(filepath)
+        content = path.read_bytes()
+        if module_label.encode() not in content:
+            label_line = f".. _{module_label}:\n\n".encode()
+            path.write_bytes(label_line + content)
+    except Exception as e:
+        print(f"failed to add label to {filepath}: {e}")
 
 
 def add_reference_labels(directory: str):
     try:
-        for filename in os.listdir(directory):
-            if filename.endswith(".rst"):
-                if filename == "index.rst":
+        tasks = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or not entry.name.endswith(".rst"):
+                    continue
+                if entry.name == "index.rst":
                     module_label = "-".join(directory.split("/")[-2:])
                 else:
-                    module_label = filename.replace(".rst", "").replace(".", "-")
-                filepath = os.path.join(directory, filename)
-                with open(filepath, "r+") as file:
-                    content = file.read()
-                    file.seek(0, 0)
-                    # module_label = filename.replace(".rst", "").replace(".", "-")
-                    if module_label not in content:
-                        label_line = f".. _{module_label}:\n\n"
-                        file.write(label_line + content)
+                    module_label = entry.name.replace(".rst", "").replace(".", "-")
+                tasks.append((entry.path, module_label))
     except Exception as e:
         print(f"directory {directory} not exists: {e}")
+        return
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda task: _add_reference_label(*task), tasks))
 
 
 if __name__ == "__main__":
@@ -1,14 +1,16 @@
 from adalflow.core.types import Document
 
 from adalflow.components.retriever import LLMRetriever
-from adalflow.components.model_client import OpenAIClient
+from adalflow.components.model_client import get_openai_client
 
 
 def test_llm_retriever():
     # TODO: directly pass Generator class is more intuitive than the generator_kwargs
 
     retriever = LLMRetriever(
-        top_k=1, model_client=OpenAIClient, model_kwargs={"model": "gpt-3.5-turbo"}
+        top_k=1,
+        model_client=get_openai_client(),
+        model_kwargs={"model": "gpt-3.5-turbo"},
     )
     print(retriever)
     documents = [
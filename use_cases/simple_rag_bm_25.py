@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from adalflow.core.generator import Generator
 from adalflow.components.data_process.data_components import (
@@ -11,7 +11,7 @@ from adalflow.core.db import LocalDB
 from adalflow.core.types import Document
 
 from adalflow.components.retriever import BM25Retriever
-from adalflow.components.model_client import OpenAIClient
+from adalflow.components.model_client import get_openai_client
 
 
 # TODO: RAG can potentially be a component itsefl and be provided to the users
@@ -50,7 +50,7 @@ Output JSON format:
     "answer": "The answer to the query",
 }"""
             },
-            model_client=OpenAIClient,
+            model_client=get_openai_client(),
             model_kwargs=self.generator_model_kwargs,
             output_processors=Sequential(JsonParser()),
         )
@@ -72,6 +72,18 @@ Output JSON format:
         response = self.generator.call(input=query, prompt_kwargs=prompt_kwargs)
         return response
 
+    def stream_generate(
+        self, query: str, context: Optional[str] = None
+    ) -> Iterator[str]:
+        if not self.generator:
+            raise ValueError("Generator is not set")
+
+        prompt_kwargs = {
+            "input_str": query,
+            "context_str": context,
+        }
+        return self.generator.stream(prompt_kwargs=prompt_kwargs)
+
     def call(self, query: str) -> Any:
         retrieved_documents = self.retriever(query)
         # fill in the document content